@@ -0,0 +1,40 @@
+"""Shared HTTP plumbing for the incident scenario scripts.
+
+Both ``test_incident_approval_workflow.py`` and ``test_incident_impact_thresholds.py``
+talk to the running API through the pooled client defined here so they keep a single
+keep-alive connection (HTTP/2 where the server offers it) across polls.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+from typing import Any
+
+import httpx
+import orjson
+
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# One pooled client for every request; ``h2`` ships with the ``httpx[http2]`` dependency.
+http_client = httpx.Client(
+    http2=True,
+    timeout=30,
+    headers={"Accept": "application/json"},
+)
+atexit.register(http_client.close)
+
+
+def parse_json(response: httpx.Response) -> dict[str, Any]:
+    """Parse JSON payloads while supporting Infinity returned by the API.
+
+    ``orjson`` handles standard JSON straight from the response bytes; payloads with
+    non-standard constants such as ``Infinity`` fall back to the stdlib parser.
+    """
+
+    content = response.content
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return json.loads(content, parse_constant=float)
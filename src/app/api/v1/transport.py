@@ -464,16 +464,16 @@ async def stream_transport_graph(
     """Expose a WebSocket that streams graph snapshots and incremental updates."""
 
     await websocket.accept()
-    queue = service.subscribe()
+    channel = service.subscribe()
     try:
-        await websocket.send_json({"type": "snapshot", "graphs": service.graph_snapshot()})
+        await websocket.send_json(service.snapshot_message())
         while True:
-            event = await queue.get()
+            event = await channel.get()
             await websocket.send_json(event)
     except WebSocketDisconnect:
         pass
     finally:
-        service.unsubscribe(queue)
+        service.unsubscribe(channel)
 
 
 @router.get(
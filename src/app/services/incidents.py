@@ -2,7 +2,7 @@
 
 import math
 from datetime import datetime
-from typing import Any, Sequence
+from typing import Any, Mapping, Sequence
 
 from app.repositories.incidents import IncidentRepository
 from app.schemas.incidents import (
@@ -156,7 +156,9 @@ class IncidentService:
             impacted_routes=impacted_routes,
         )
 
-    def _resolve_edge_context(self, *, latitude: float, longitude: float) -> dict[str, Any] | None:
+    def _resolve_edge_context(
+        self, *, latitude: float, longitude: float
+    ) -> Mapping[str, Any] | None:
         """Lookup the closest transit edge and return its metadata, if any."""
 
         try:
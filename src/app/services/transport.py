@@ -3,37 +3,48 @@
 from __future__ import annotations
 
 import asyncio
-from asyncio import Queue, QueueEmpty, QueueFull
-from contextlib import suppress
+from asyncio import QueueEmpty
+from collections import deque
 from dataclasses import dataclass
-from math import asin, cos, radians, sin, sqrt
+from math import degrees
 from pathlib import Path
-from threading import Lock
-from typing import Any, Iterable, Sequence
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, Sequence
 
 import gtfs_kit as gk
 import networkx as nx
+import numpy as np
 import pandas as pd
 
 from app.core.node_mapping import get_node_name
+from app.utils.geo import (
+    EARTH_RADIUS_KM,
+    any_within_radius,
+    distances_from_point_km,
+    edge_distances_km,
+)
 
 
 WEIGHT_EPSILON = 1e-6
-EDGE_METADATA_EXCLUDE = {
-    "weight",
-    "default_weight",
-    "mode",
-    "distance_km",
-    "speed_kmh",
-    "connector",
-}
+NEAREST_EDGE_SEED_WINDOW = 32
+FAST_PATH_MAX_WEIGHT_CV = 0.1
+EDGE_METADATA_EXCLUDE: frozenset[str] = frozenset(
+    {
+        "weight",
+        "default_weight",
+        "mode",
+        "distance_km",
+        "speed_kmh",
+        "connector",
+    }
+)
 
 
 class MultimodalDiGraph(nx.MultiDiGraph):
     """Thin wrapper around :class:`networkx.MultiDiGraph` for clarity."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BikeParkingLocation:
     """Geographical representation of a bike parking facility."""
 
@@ -42,6 +53,54 @@ class BikeParkingLocation:
     name: str | None = None
 
 
+class SubscriberChannel:
+    """Per-subscriber event buffer that coalesces graph snapshots.
+
+    Only the most recent snapshot is kept and any edge updates queued before it are
+    dropped, since the snapshot already reflects them. Later edge updates are delivered
+    in order, keeping at most ``maxsize`` of them and discarding the oldest first.
+    """
+
+    __slots__ = ("_snapshot", "_updates", "_ready")
+
+    def __init__(self, maxsize: int = 128) -> None:
+        self._snapshot: dict[str, Any] | None = None
+        self._updates: deque[dict[str, Any]] = deque(maxlen=maxsize)
+        self._ready = asyncio.Event()
+
+    def put(self, event: dict[str, Any]) -> None:
+        """Buffer an event without blocking."""
+
+        if event.get("type") == "snapshot":
+            self._snapshot = event
+            self._updates.clear()
+        else:
+            self._updates.append(event)
+        self._ready.set()
+
+    def get_nowait(self) -> dict[str, Any]:
+        """Return the next pending event or raise :class:`asyncio.QueueEmpty`."""
+
+        if self._snapshot is not None:
+            event, self._snapshot = self._snapshot, None
+        elif self._updates:
+            event = self._updates.popleft()
+        else:
+            raise QueueEmpty
+        if not self._updates and self._snapshot is None:
+            self._ready.clear()
+        return event
+
+    async def get(self) -> dict[str, Any]:
+        """Wait for and return the next pending event."""
+
+        while True:
+            try:
+                return self.get_nowait()
+            except QueueEmpty:
+                await self._ready.wait()
+
+
 class TransportGraphService:
     """Construct and manage multimodal transport graphs from GTFS sources."""
 
@@ -67,13 +126,36 @@ class TransportGraphService:
         bike_access_radius_m: float = 150.0,
     ) -> None:
         self._feed_path = feed_path
+        self._resolved_feed_path: Path | None = None
         self._walker_speed_kmh = walker_speed_kmh
         self._bike_speed_kmh = bike_speed_kmh
+        # Seconds needed per kilometre, so hot loops multiply instead of dividing.
+        self._walker_seconds_per_km = 3600 / walker_speed_kmh
+        self._bike_seconds_per_km = 3600 / bike_speed_kmh
         self._bike_access_radius_km = bike_access_radius_m / 1000
         self._graphs: dict[str, MultimodalDiGraph] = {}
-        self._bike_parkings: list[BikeParkingLocation] = []
-        self._subscribers: set[Queue[dict[str, Any]]] = set()
-        self._subscribers_lock = Lock()
+        self._parking_latitudes: np.ndarray = np.empty(0, dtype=np.float64)
+        self._parking_longitudes: np.ndarray = np.empty(0, dtype=np.float64)
+        # Replaced wholesale on (un)subscribe so readers always see a consistent tuple.
+        self._subscribers: tuple[SubscriberChannel, ...] = ()
+        self._subscriber_loop: asyncio.AbstractEventLoop | None = None
+        self._node_id_to_idx: dict[str, int] = {}
+        self._idx_to_node_id: list[str] = []
+        self._node_latitudes: np.ndarray = np.empty(0, dtype=np.float64)
+        self._node_longitudes: np.ndarray = np.empty(0, dtype=np.float64)
+        self._node_bike_accessible: np.ndarray = np.empty(0, dtype=bool)
+        self._bike_edge_sources: np.ndarray = np.empty(0, dtype=np.int32)
+        self._bike_edge_targets: np.ndarray = np.empty(0, dtype=np.int32)
+        self._bike_edge_distances_km: np.ndarray = np.empty(0, dtype=np.float64)
+        self._bike_edge_fast: np.ndarray = np.empty(0, dtype=bool)
+        self._transit_edge_refs: list[tuple[str, str | int]] = []
+        self._transit_edge_sources: np.ndarray = np.empty(0, dtype=np.int32)
+        self._transit_edge_targets: np.ndarray = np.empty(0, dtype=np.int32)
+        self._transit_edge_route_ids: np.ndarray = np.empty(0, dtype=object)
+        self._transit_midpoint_lats: np.ndarray = np.empty(0, dtype=np.float64)
+        self._transit_midpoint_lons: np.ndarray = np.empty(0, dtype=np.float64)
+        self._graph_versions: dict[str, int] = {}
+        self._snapshot_cache: dict[str, tuple[int, dict[str, Any]]] = {}
 
     async def build_graphs(self) -> None:
         """Load the GTFS feed and populate transport graphs."""
@@ -100,7 +182,12 @@ class TransportGraphService:
     ) -> None:
         """Register bike parking locations and refresh bike accessibility metadata."""
 
-        self._bike_parkings = list(locations)
+        coordinates = np.fromiter(
+            ((location.latitude, location.longitude) for location in locations),
+            dtype=np.dtype((np.float64, 2)),
+        )
+        self._parking_latitudes = np.ascontiguousarray(coordinates[:, 0])
+        self._parking_longitudes = np.ascontiguousarray(coordinates[:, 1])
         if proximity_override_m is not None:
             self._bike_access_radius_km = proximity_override_m / 1000
         self._annotate_bike_accessible_nodes()
@@ -163,6 +250,11 @@ class TransportGraphService:
 
         # Update edge attributes using NetworkX's proper method
         graph.add_edge(source, target, key=resolved_key, **edge_payload)
+        position = graph.graph["_edge_positions"].get((source, target, resolved_key))
+        if position is not None:
+            graph.graph["_impacted"][position] = self._is_edge_impacted(edge_payload)
+            graph.graph["_current_weights"][position] = self._edge_current_weight(edge_payload)
+        self._patch_cached_edge(mode, graph, position, source, target, resolved_key)
 
         result = {
             "mode": mode,
@@ -211,17 +303,17 @@ class TransportGraphService:
         *,
         latitude: float,
         longitude: float,
-    ) -> dict[str, Any]:
-        """Return metadata describing the closest non-walking/non-bike edge."""
+    ) -> Mapping[str, Any]:
+        """Return read-only metadata describing the closest non-walking/non-bike edge."""
 
         mode, source, target, key, distance_km = self._closest_transit_edge_match(
             latitude=latitude,
             longitude=longitude,
         )
         graph = self.get_graph(mode)
-        edge_data = dict(graph[source][target][key])
-        edge_data.update(
+        return MappingProxyType(
             {
+                **graph[source][target][key],
                 "mode": mode,
                 "source": source,
                 "target": target,
@@ -229,7 +321,6 @@ class TransportGraphService:
                 "distance_to_point_km": distance_km,
             }
         )
-        return edge_data
 
     def plan_route_with_incidents(
         self,
@@ -249,7 +340,7 @@ class TransportGraphService:
             raise ValueError(msg)
 
         try:
-            default_nodes = nx.shortest_path(graph, source, target, weight="default_weight")
+            default_nodes = self._fast_path(graph, source, target)
         except nx.NetworkXNoPath as exc:
             msg = f"No path exists between '{source}' and '{target}' in mode '{mode}'."
             raise ValueError(msg) from exc
@@ -262,12 +353,7 @@ class TransportGraphService:
         if incident_detected:
             clean_graph = self._graph_without_impacted_edges(graph)
             try:
-                alternative_nodes = nx.shortest_path(
-                    clean_graph,
-                    source,
-                    target,
-                    weight="default_weight",
-                )
+                alternative_nodes = self._fast_path(clean_graph, source, target)
             except nx.NetworkXNoPath:
                 alternative_nodes = None
 
@@ -294,35 +380,70 @@ class TransportGraphService:
             "suggested_path": alternative_path_payload,
         }
 
+    def _fast_path(
+        self,
+        graph: MultimodalDiGraph,
+        source: str,
+        target: str,
+    ) -> list[str]:
+        """Return a minimum default-weight path, trying a hop-count search first.
+
+        On graphs with near-uniform default weights an unweighted BFS path is accepted
+        when its weight matches the lower bound ``hops * min_default_weight`` that every
+        path must pay, which proves it optimal; otherwise Dijkstra decides.
+        """
+
+        if graph.graph.get("weight_cv", float("inf")) < FAST_PATH_MAX_WEIGHT_CV:
+            nodes = nx.shortest_path(graph, source, target)
+            lower_bound = (len(nodes) - 1) * graph.graph["min_default_weight"]
+            if nx.path_weight(graph, nodes, "default_weight") <= lower_bound + WEIGHT_EPSILON:
+                return nodes
+
+        _, nodes = nx.bidirectional_dijkstra(graph, source, target, weight="default_weight")
+        return nodes
+
     def _build_route_segments(
         self,
         graph: MultimodalDiGraph,
         nodes: Sequence[str],
     ) -> list[dict[str, Any]]:
-        """Resolve edge details for a sequence of nodes."""
-
-        segments: list[dict[str, Any]] = []
-        for source, target in zip(nodes, nodes[1:]):
-            key, data = self._resolve_edge_for_path(graph, source, target)
-            default_weight = self._edge_default_weight(data)
-            current_weight = self._edge_current_weight(data)
-            impacted = self._is_edge_impacted(data)
-            metadata = self._extract_edge_metadata(data)
-
-            segment = {
+        """Resolve edge details for a sequence of nodes.
+
+        Weights and impact flags are gathered from the per-edge arrays kept by
+        ``_index_edges``; only descriptive attributes are read from the edge payloads.
+        """
+
+        hops = list(zip(nodes, nodes[1:]))
+        edge_positions = graph.graph["_edge_positions"]
+        keys: list[str | int | None] = [None] * len(hops)
+        positions = np.empty(len(hops), dtype=np.intp)
+        for index, (source, target) in enumerate(hops):
+            key, _ = self._resolve_edge_for_path(graph, source, target)
+            keys[index] = key
+            positions[index] = edge_positions[(source, target, key)]
+
+        default_weights = graph.graph["_default_weights"][positions].tolist()
+        current_weights = graph.graph["_current_weights"][positions].tolist()
+        impacted = graph.graph["_impacted"][positions].tolist()
+        graph_mode = graph.graph.get("mode")
+
+        segments: list[dict[str, Any] | None] = [None] * len(hops)
+        for index, (source, target) in enumerate(hops):
+            key = keys[index]
+            data = graph[source][target][key]
+            segments[index] = {
                 "source": source,
                 "target": target,
                 "key": key,
-                "mode": data.get("mode", graph.graph.get("mode")),
-                "default_weight": default_weight,
-                "current_weight": current_weight,
-                "impacted": impacted,
+                "mode": data.get("mode", graph_mode),
+                "default_weight": default_weights[index],
+                "current_weight": current_weights[index],
+                "impacted": impacted[index],
                 "distance_km": data.get("distance_km"),
                 "speed_kmh": data.get("speed_kmh"),
                 "connector": data.get("connector"),
-                "metadata": metadata or None,
+                "metadata": self._extract_edge_metadata(data) or None,
             }
-            segments.append(segment)
         return segments
 
     def _shape_route_payload(
@@ -349,17 +470,19 @@ class TransportGraphService:
         self,
         graph: MultimodalDiGraph,
     ) -> MultimodalDiGraph:
-        """Return a copy of the graph without edges currently impacted by incidents."""
+        """Return a read-only view of the graph hiding edges currently impacted by incidents."""
 
-        clean_graph = graph.copy()
-        impacted_edges = [
-            (source, target, key)
-            for source, target, key, data in graph.edges(keys=True, data=True)
-            if self._is_edge_impacted(data)
-        ]
-        if impacted_edges:
-            clean_graph.remove_edges_from(impacted_edges)
-        return clean_graph
+        edge_index = graph.graph["_edge_index"]
+        impacted_edges = {
+            edge_index[position] for position in np.flatnonzero(graph.graph["_impacted"]).tolist()
+        }
+        if not impacted_edges:
+            return graph
+
+        def keep_edge(source: str, target: str, key: str | int) -> bool:
+            return (source, target, key) not in impacted_edges
+
+        return nx.subgraph_view(graph, filter_edge=keep_edge)
 
     def _resolve_edge_for_path(
         self,
@@ -369,11 +492,28 @@ class TransportGraphService:
     ) -> tuple[str | int, dict[str, Any]]:
         """Return the edge data representing the default traversal between two nodes."""
 
+        min_edge = graph.graph.get("_min_edge", {}).get((source, target))
+        if min_edge is not None:
+            best_key = min_edge[0]
+            return best_key, graph[source][target][best_key]
+
         edges = graph.get_edge_data(source, target)
         if not edges:
             msg = f"No edge found between '{source}' and '{target}'."
             raise ValueError(msg)
 
+        best = self._pick_default_edge(edges)
+        if best is None:
+            msg = f"Unable to determine default edge for '{source}' -> '{target}'."
+            raise ValueError(msg)
+
+        return best[0], edges[best[0]]
+
+    def _pick_default_edge(
+        self, edges: dict[str | int, dict[str, Any]]
+    ) -> tuple[str | int, float] | None:
+        """Return the key and weight of the parallel edge with the lowest default weight."""
+
         best_key: str | int | None = None
         best_weight = float("inf")
         for key, data in edges.items():
@@ -383,10 +523,8 @@ class TransportGraphService:
                 best_weight = default_weight
 
         if best_key is None:
-            msg = f"Unable to determine default edge for '{source}' -> '{target}'."
-            raise ValueError(msg)
-
-        return best_key, edges[best_key]
+            return None
+        return best_key, best_weight
 
     @staticmethod
     def _edge_default_weight(data: dict[str, Any]) -> float:
@@ -435,32 +573,40 @@ class TransportGraphService:
     ) -> tuple[str, str, str, str | int, float]:
         """Locate the closest transit edge (excluding walking and bike modes)."""
 
-        best_match: tuple[str, str, str, str | int, float] | None = None
-
-        for mode, graph in self._graphs.items():
-            if mode in {"walking", "bike"}:
-                continue
-            for source, target, key in graph.edges(keys=True):
-                source_attrs = graph.nodes[source]
-                target_attrs = graph.nodes[target]
-                if not self._has_coordinates(source_attrs) or not self._has_coordinates(target_attrs):
-                    continue
-                midpoint_lat = (source_attrs["latitude"] + target_attrs["latitude"]) / 2
-                midpoint_lon = (source_attrs["longitude"] + target_attrs["longitude"]) / 2
-                distance_km = self._haversine_km(
-                    latitude,
-                    longitude,
-                    midpoint_lat,
-                    midpoint_lon,
-                )
-                if best_match is None or distance_km < best_match[4]:
-                    best_match = (mode, source, target, key, distance_km)
-
-        if best_match is None:
+        if not self._transit_edge_refs:
             msg = "No transit edges available to evaluate."
             raise ValueError(msg)
 
-        return best_match
+        # Midpoints are sorted by latitude. A great-circle distance is never shorter
+        # than the meridian distance between the two latitudes, so once a seed window
+        # yields a candidate distance, only midpoints inside the matching latitude band
+        # can be closer and the exact search is limited to that slice.
+        latitudes = self._transit_midpoint_lats
+        longitudes = self._transit_midpoint_lons
+        position = int(np.searchsorted(latitudes, latitude))
+        seed = slice(
+            max(position - NEAREST_EDGE_SEED_WINDOW, 0), position + NEAREST_EDGE_SEED_WINDOW
+        )
+        seed_distance_km = float(
+            distances_from_point_km(latitude, longitude, latitudes[seed], longitudes[seed]).min()
+        )
+        band_deg = degrees(seed_distance_km / EARTH_RADIUS_KM) * (1 + 1e-9) + 1e-12
+        lower = int(np.searchsorted(latitudes, latitude - band_deg, side="left"))
+        upper = int(np.searchsorted(latitudes, latitude + band_deg, side="right"))
+
+        distances_km = distances_from_point_km(
+            latitude, longitude, latitudes[lower:upper], longitudes[lower:upper]
+        )
+        offset = int(np.argmin(distances_km))
+        position = lower + offset
+        mode, key = self._transit_edge_refs[position]
+        return (
+            mode,
+            self._idx_to_node_id[self._transit_edge_sources[position]],
+            self._idx_to_node_id[self._transit_edge_targets[position]],
+            key,
+            float(distances_km[offset]),
+        )
 
     def get_routes_near_coordinates(
         self,
@@ -470,36 +616,33 @@ class TransportGraphService:
     ) -> list[str]:
         """Find all unique route IDs for transit edges within distance of any coordinate."""
 
-        route_ids: set[str] = set()
-
+        if not coordinates or not self._transit_edge_refs:
+            return []
+
+        # Check distance to both endpoints and the midpoint of every cached transit edge,
+        # one vectorised pass per coordinate.
+        points = (
+            (
+                self._node_latitudes[self._transit_edge_sources],
+                self._node_longitudes[self._transit_edge_sources],
+            ),
+            (
+                self._node_latitudes[self._transit_edge_targets],
+                self._node_longitudes[self._transit_edge_targets],
+            ),
+            (self._transit_midpoint_lats, self._transit_midpoint_lons),
+        )
+        near = np.zeros(len(self._transit_edge_refs), dtype=bool)
         for latitude, longitude in coordinates:
-            for mode, graph in self._graphs.items():
-                if mode in {"walking", "bike"}:
-                    continue
-                for source, target, key in graph.edges(keys=True):
-                    source_attrs = graph.nodes[source]
-                    target_attrs = graph.nodes[target]
-                    if not self._has_coordinates(source_attrs) or not self._has_coordinates(target_attrs):
-                        continue
-
-                    # Check distance to both endpoints and midpoint
-                    distances = [
-                        self._haversine_km(latitude, longitude, source_attrs["latitude"], source_attrs["longitude"]),
-                        self._haversine_km(latitude, longitude, target_attrs["latitude"], target_attrs["longitude"]),
-                        self._haversine_km(
-                            latitude,
-                            longitude,
-                            (source_attrs["latitude"] + target_attrs["latitude"]) / 2,
-                            (source_attrs["longitude"] + target_attrs["longitude"]) / 2,
-                        ),
-                    ]
-
-                    if any(distance <= max_distance_km for distance in distances):
-                        edge_data = graph[source][target][key]
-                        if route_id := edge_data.get("route_id"):
-                            route_ids.add(str(route_id))
-
-        return sorted(route_ids)
+            for latitudes, longitudes in points:
+                near |= (
+                    distances_from_point_km(latitude, longitude, latitudes, longitudes)
+                    <= max_distance_km
+                )
+
+        return sorted(
+            {str(route_id) for route_id in self._transit_edge_route_ids[near].tolist() if route_id}
+        )
 
     # ---------------------------------------------------------------------
     # Internal helpers
@@ -531,13 +674,143 @@ class TransportGraphService:
             nodes_payload[stop_id] = node_attrs
 
         base_graphs = self._build_transit_graphs(feed, nodes_payload)
+        self._register_node_ids(nodes_payload, base_graphs.values())
         walking_graph = self._build_walking_graph(nodes_payload, base_graphs)
         self._graphs = {**base_graphs, "walking": walking_graph}
+        for mode, graph in self._graphs.items():
+            self._index_edges(graph)
+            self._mark_graph_changed(mode)
+
+        self._index_transit_edges()
 
         # Precompute bike metadata even if there are no parkings yet.
         self._annotate_bike_accessible_nodes()
         self._refresh_bike_graph()
 
+    def _register_node_ids(
+        self,
+        nodes_payload: dict[str, dict[str, float]],
+        graphs: Iterable[MultimodalDiGraph],
+    ) -> None:
+        """Assign compact integer indices to stop identifiers.
+
+        Internal arrays refer to nodes by these ``int32`` indices; stop identifiers are only
+        looked up again when results leave the service. Stops referenced by trips but missing
+        from ``stops.txt`` are appended after the feed's stops.
+        """
+
+        node_ids = list(nodes_payload)
+        node_id_to_idx = {node_id: index for index, node_id in enumerate(node_ids)}
+        for graph in graphs:
+            for node_id in graph:
+                if node_id not in node_id_to_idx:
+                    node_id_to_idx[node_id] = len(node_ids)
+                    node_ids.append(node_id)
+        self._node_id_to_idx = node_id_to_idx
+        self._idx_to_node_id = node_ids
+
+        # Stop coordinates indexed by node index; stops without coordinates hold NaN.
+        latitudes = np.full(len(node_ids), np.nan)
+        longitudes = np.full(len(node_ids), np.nan)
+        for node_id, attrs in nodes_payload.items():
+            index = node_id_to_idx[node_id]
+            latitudes[index] = attrs["latitude"]
+            longitudes[index] = attrs["longitude"]
+        self._node_latitudes = latitudes
+        self._node_longitudes = longitudes
+
+    def _index_edges(self, graph: MultimodalDiGraph) -> None:
+        """Record edge positions, weight arrays and an incident impact mask on the graph.
+
+        ``update_edge`` keeps the mask and current weights in sync, so impacted edges and
+        route weights can be read with array operations instead of re-evaluating every
+        edge payload.
+        """
+
+        edge_index = list(graph.edges(keys=True))
+        graph.graph["_edge_index"] = edge_index
+        graph.graph["_edge_positions"] = {
+            edge: position for position, edge in enumerate(edge_index)
+        }
+        graph.graph["_impacted"] = np.fromiter(
+            (self._is_edge_impacted(data) for _, _, data in graph.edges(data=True)),
+            dtype=bool,
+            count=len(edge_index),
+        )
+
+        graph.graph["_default_weights"] = np.fromiter(
+            (self._edge_default_weight(data) for _, _, data in graph.edges(data=True)),
+            dtype=np.float64,
+            count=len(edge_index),
+        )
+        graph.graph["_current_weights"] = np.fromiter(
+            (self._edge_current_weight(data) for _, _, data in graph.edges(data=True)),
+            dtype=np.float64,
+            count=len(edge_index),
+        )
+        self._record_weight_stats(graph)
+
+        # Default weights only change when the bike graph is refreshed, so the cheapest
+        # parallel edge per node pair can be resolved once instead of on every route.
+        min_edges: dict[tuple[str, str], tuple[str | int, float]] = {}
+        for (source, target, key), weight in zip(
+            edge_index, graph.graph["_default_weights"].tolist()
+        ):
+            best = min_edges.get((source, target))
+            if weight < (best[1] if best is not None else float("inf")):
+                min_edges[(source, target)] = (key, weight)
+        graph.graph["_min_edge"] = min_edges
+
+    @staticmethod
+    def _record_weight_stats(graph: MultimodalDiGraph) -> None:
+        """Store default-weight statistics used to pick a shortest-path strategy."""
+
+        default_weights = graph.graph["_default_weights"]
+        mean_weight = float(default_weights.mean()) if default_weights.size else 0.0
+        graph.graph["weight_cv"] = (
+            float(default_weights.std()) / mean_weight if mean_weight > 0 else float("inf")
+        )
+        graph.graph["min_default_weight"] = (
+            float(default_weights.min()) if default_weights.size else 0.0
+        )
+
+    def _index_transit_edges(self) -> None:
+        """Cache transit edges with midpoint coordinates, sorted by latitude, for lookups."""
+
+        node_id_to_idx = self._node_id_to_idx
+        refs: list[tuple[str, str | int]] = []
+        route_ids: list[Any] = []
+        sources: list[int] = []
+        targets: list[int] = []
+        midpoint_lats: list[float] = []
+        midpoint_lons: list[float] = []
+        for mode, graph in self._graphs.items():
+            if mode in {"walking", "bike"}:
+                continue
+            nodes = graph.nodes
+            for source, target, key in graph.edges(keys=True):
+                source_attrs = nodes[source]
+                target_attrs = nodes[target]
+                if not (
+                    self._has_coordinates(source_attrs) and self._has_coordinates(target_attrs)
+                ):
+                    continue
+                refs.append((mode, key))
+                route_ids.append(graph[source][target][key].get("route_id"))
+                sources.append(node_id_to_idx[source])
+                targets.append(node_id_to_idx[target])
+                midpoint_lats.append((source_attrs["latitude"] + target_attrs["latitude"]) / 2)
+                midpoint_lons.append((source_attrs["longitude"] + target_attrs["longitude"]) / 2)
+
+        latitudes = np.array(midpoint_lats, dtype=np.float64)
+        order = np.argsort(latitudes, kind="stable")
+        self._transit_edge_refs = [refs[index] for index in order.tolist()]
+        self._transit_edge_sources = np.array(sources, dtype=np.int32)[order]
+        self._transit_edge_targets = np.array(targets, dtype=np.int32)[order]
+        self._transit_edge_route_ids = np.array(route_ids, dtype=object)[order]
+        self._transit_midpoint_lats = latitudes[order]
+        self._transit_midpoint_lons = np.array(midpoint_lons, dtype=np.float64)[order]
+
     def _narrow_feed_to_single_date(self, feed: gk.Feed) -> gk.Feed:
         """Restrict the feed to the first available service date to reduce graph size."""
 
@@ -558,44 +831,78 @@ class TransportGraphService:
 
         graphs: dict[str, MultimodalDiGraph] = {}
 
-        stop_times = feed.stop_times.copy()
-        stop_times = stop_times.sort_values(["trip_id", "stop_sequence"])
-        stop_times["next_stop_id"] = stop_times.groupby("trip_id")["stop_id"].shift(-1)
-
-        stop_times["arrival_seconds"] = self._time_to_seconds(stop_times["arrival_time"])
-        stop_times["next_arrival_seconds"] = stop_times.groupby("trip_id")["arrival_seconds"].shift(-1)
-        stop_times["segment_duration"] = (
-            stop_times["next_arrival_seconds"] - stop_times["arrival_seconds"]
+        # Sort once and pair each stop time with its successor through array slicing;
+        # a pair forms a segment when both rows belong to the same trip and time moves
+        # forward, which replaces the per-trip groupby shifts.
+        stop_times = feed.stop_times.sort_values(["trip_id", "stop_sequence"], kind="stable")
+        trip_ids = stop_times["trip_id"].to_numpy()
+        stop_ids = stop_times["stop_id"].to_numpy()
+        arrivals = self._time_to_seconds(stop_times["arrival_time"]).to_numpy(dtype=np.float64)
+
+        durations = arrivals[1:] - arrivals[:-1]
+        valid = (trip_ids[:-1] == trip_ids[1:]) & (durations > 0)
+
+        # Trips and routes are keyed by unique ids, so route attributes are gathered with
+        # index lookups instead of materialising two DataFrame merges. Each lookup array
+        # ends with a missing-value sentinel that position -1 (unknown id) falls onto.
+        segment_trip_ids = trip_ids[:-1][valid]
+        trips = feed.trips.drop_duplicates("trip_id")
+        routes = feed.routes.drop_duplicates("route_id")
+        trip_positions = pd.Index(trips["trip_id"]).get_indexer(segment_trip_ids)
+        route_ids = np.append(trips["route_id"].to_numpy(dtype=object), None)[trip_positions]
+        route_positions = pd.Index(routes["route_id"]).get_indexer(route_ids)
+        segment_route_types = np.append(
+            routes["route_type"].to_numpy(dtype=np.float64), np.nan
+        )[route_positions]
+        known = ~np.isnan(segment_route_types)
+
+        route_types, group_index = np.unique(
+            segment_route_types[known].astype(np.int64), return_inverse=True
         )
+        route_positions = route_positions[known]
+        columns = [
+            stop_ids[:-1][valid][known],
+            stop_ids[1:][valid][known],
+            segment_trip_ids[known],
+            durations[valid][known],
+            route_ids[known],
+            *(
+                np.append(routes[column].to_numpy(dtype=object), None)[route_positions]
+                for column in ("route_short_name", "route_long_name")
+            ),
+        ]
 
-        merged = stop_times.dropna(subset=["next_stop_id", "segment_duration"]).copy()
-
-        trips = feed.trips[["trip_id", "route_id"]]
-        routes = feed.routes[["route_id", "route_type", "route_short_name", "route_long_name"]]
-        merged = merged.merge(trips, on="trip_id", how="left")
-        merged = merged.merge(routes, on="route_id", how="left")
-
-        for mode, segments in merged.groupby("route_type"):
-            label = self._ROUTE_TYPE_LABELS.get(int(mode), f"route_type_{int(mode)}")
+        for group, route_type in enumerate(route_types.tolist()):
+            label = self._ROUTE_TYPE_LABELS.get(route_type, f"route_type_{route_type}")
             graph = MultimodalDiGraph(mode=label)
             self._add_nodes(graph, nodes_payload)
 
-            for row in segments.itertuples(index=False):
-                duration = float(row.segment_duration)
-                if duration <= 0:
-                    continue
-                graph.add_edge(
-                    row.stop_id,
-                    row.next_stop_id,
-                    key=row.trip_id,
-                    weight=duration,
-                    default_weight=duration,
-                    mode=label,
-                    trip_id=row.trip_id,
-                    route_id=row.route_id,
-                    route_short_name=row.route_short_name,
-                    route_long_name=row.route_long_name,
+            rows = np.flatnonzero(group_index == group)
+            graph.add_edges_from(
+                (
+                    source,
+                    target,
+                    trip_id,
+                    {
+                        "weight": duration,
+                        "default_weight": duration,
+                        "mode": label,
+                        "trip_id": trip_id,
+                        "route_id": route_id,
+                        "route_short_name": route_short_name,
+                        "route_long_name": route_long_name,
+                    },
                 )
+                for (
+                    source,
+                    target,
+                    trip_id,
+                    duration,
+                    route_id,
+                    route_short_name,
+                    route_long_name,
+                ) in zip(*(column[rows].tolist() for column in columns))
+            )
 
             graphs[label] = graph
 
@@ -611,42 +918,51 @@ class TransportGraphService:
         walking_graph = MultimodalDiGraph(mode="walking")
         self._add_nodes(walking_graph, nodes_payload)
 
-        walking_edges: dict[tuple[str, str], dict[str, Any]] = {}
-
+        # Walking payloads are symmetric and the distance of a stop pair does not depend
+        # on direction, so each undirected pair is kept once, in the direction it was
+        # first seen, and expanded to both directions when adding edges.
+        pairs: dict[tuple[str, str], tuple[str, str]] = {}
         for graph in base_graphs.values():
-            for source, target, _key in graph.edges(keys=True):
+            for source, target in graph.edges():
                 if source == target:
                     continue
-                edge_key = (source, target)
-                reverse_key = (target, source)
-                distance_km = self._distance_between_nodes(nodes_payload, source, target)
-                if distance_km == 0:
-                    continue
-                travel_seconds = self._travel_time_seconds(distance_km, self._walker_speed_kmh)
-
-                candidate_payload = {
-                    "mode": "walking",
-                    "distance_km": distance_km,
-                    "speed_kmh": self._walker_speed_kmh,
-                    "weight": travel_seconds,
-                    "default_weight": travel_seconds,
-                }
-
-                if (
-                    edge_key not in walking_edges
-                    or travel_seconds < walking_edges[edge_key]["weight"]
-                ):
-                    walking_edges[edge_key] = candidate_payload
-                if (
-                    reverse_key not in walking_edges
-                    or travel_seconds < walking_edges[reverse_key]["weight"]
-                ):
-                    walking_edges[reverse_key] = candidate_payload
+                pair_key = (source, target) if source < target else (target, source)
+                if pair_key not in pairs:
+                    pairs[pair_key] = (source, target)
+
+        node_id_to_idx = self._node_id_to_idx
+        distances_km = edge_distances_km(
+            self._node_latitudes,
+            self._node_longitudes,
+            np.fromiter(
+                (node_id_to_idx[source] for source, _ in pairs.values()),
+                dtype=np.int32,
+                count=len(pairs),
+            ),
+            np.fromiter(
+                (node_id_to_idx[target] for _, target in pairs.values()),
+                dtype=np.int32,
+                count=len(pairs),
+            ),
+        )
 
-        for (source, target), payload in walking_edges.items():
-            walking_graph.add_edge(source, target, key=f"walk-{source}-{target}", **payload)
+        ebunch: list[tuple[str, str, str, dict[str, Any]]] = []
+        for (source, target), distance_km in zip(pairs.values(), distances_km.tolist()):
+            if not distance_km > 0:
+                continue
+            travel_seconds = distance_km * self._walker_seconds_per_km
+            payload = {
+                "mode": "walking",
+                "distance_km": distance_km,
+                "speed_kmh": self._walker_speed_kmh,
+                "weight": travel_seconds,
+                "default_weight": travel_seconds,
+            }
+            ebunch.append((source, target, f"walk-{source}-{target}", payload))
+            ebunch.append((target, source, f"walk-{target}-{source}", payload))
+        walking_graph.add_edges_from(ebunch)
 
-        self._ensure_connected(walking_graph, nodes_payload, self._walker_speed_kmh, mode="walking")
+        self._ensure_connected(walking_graph, self._walker_speed_kmh, mode="walking")
         return walking_graph
 
     def _add_nodes(
@@ -654,43 +970,77 @@ class TransportGraphService:
     ) -> None:
         """Populate a graph with nodes storing geographical metadata."""
 
-        for node_id, attrs in nodes_payload.items():
-            graph.add_node(node_id, **attrs)
+        graph.add_nodes_from(nodes_payload.items())
 
     def _ensure_connected(
         self,
         graph: MultimodalDiGraph,
-        nodes_payload: dict[str, dict[str, float]],
         speed_kmh: float,
         *,
         mode: str,
     ) -> None:
         """Add additional edges until the directed graph becomes weakly connected."""
 
+        node_ids = list(graph.nodes)
+        if not node_ids:
+            return
+        node_id_to_idx = self._node_id_to_idx
+        node_indices = np.fromiter(
+            (node_id_to_idx[node] for node in node_ids), dtype=np.int32, count=len(node_ids)
+        )
+        latitudes = self._node_latitudes[node_indices]
+        order = np.argsort(latitudes, kind="stable")
+        node_ids = [node_ids[index] for index in order.tolist()]
+        latitudes = latitudes[order]
+        longitudes = self._node_longitudes[node_indices[order]]
+        positions = {node: index for index, node in enumerate(node_ids)}
+
+        # Component labels are computed once and merged in place as connectors are added.
+        labels = np.empty(len(node_ids), dtype=np.int64)
+        for label, component in enumerate(nx.weakly_connected_components(graph)):
+            labels[[positions[node] for node in component]] = label
+
+        connectors: list[tuple[str, str, str, dict[str, Any]]] = []
         while True:
-            components = list(nx.weakly_connected_components(graph))
-            if len(components) <= 1:
+            component_labels, sizes = np.unique(labels, return_counts=True)
+            if component_labels.size <= 1:
                 break
 
-            source_component = components[0]
-            best_pair: tuple[str, str] | None = None
+            # Stitch the smallest component to its nearest outside node. Nodes are sorted
+            # by latitude and a great-circle distance is never shorter than the meridian
+            # distance, so once a candidate is known only a latitude band needs scanning.
+            source_label = component_labels[int(np.argmin(sizes))]
+            best_pair: tuple[int, int] | None = None
             best_distance = float("inf")
 
-            for source in source_component:
-                for target in graph.nodes:
-                    if target in source_component:
-                        continue
-                    distance_km = self._distance_between_nodes(nodes_payload, source, target)
-                    if distance_km == 0:
-                        continue
-                    if distance_km < best_distance:
-                        best_distance = distance_km
-                        best_pair = (source, target)
+            for source in np.flatnonzero(labels == source_label).tolist():
+                source_lat = latitudes[source]
+                if best_pair is None:
+                    lower, upper = 0, len(node_ids)
+                else:
+                    band_deg = degrees(best_distance / EARTH_RADIUS_KM) * (1 + 1e-9) + 1e-12
+                    lower = int(np.searchsorted(latitudes, source_lat - band_deg, side="left"))
+                    upper = int(np.searchsorted(latitudes, source_lat + band_deg, side="right"))
+                distances_km = distances_from_point_km(
+                    source_lat,
+                    longitudes[source],
+                    latitudes[lower:upper],
+                    longitudes[lower:upper],
+                )
+                distances_km[(labels[lower:upper] == source_label) | (distances_km == 0)] = np.inf
+                offset = int(np.argmin(distances_km))
+                distance_km = float(distances_km[offset])
+                if distance_km < best_distance:
+                    best_distance = distance_km
+                    best_pair = (source, lower + offset)
 
             if best_pair is None:
                 break
 
-            source, target = best_pair
+            source_index, target_index = best_pair
+            labels[labels == labels[target_index]] = source_label
+            source = node_ids[source_index]
+            target = node_ids[target_index]
             travel_seconds = self._travel_time_seconds(best_distance, speed_kmh)
             payload = {
                 "mode": mode,
@@ -700,36 +1050,45 @@ class TransportGraphService:
                 "default_weight": travel_seconds,
                 "connector": True,
             }
-            graph.add_edge(source, target, key=f"{mode}-connector-{source}-{target}", **payload)
-            graph.add_edge(target, source, key=f"{mode}-connector-{target}-{source}", **payload)
-
-    def _distance_between_nodes(
-        self, nodes_payload: dict[str, dict[str, float]], source: str, target: str
-    ) -> float:
-        """Return the great-circle distance between two nodes expressed in kilometres."""
-
-        source_payload = nodes_payload[source]
-        target_payload = nodes_payload[target]
-
-        return self._haversine_km(
-            source_payload["latitude"],
-            source_payload["longitude"],
-            target_payload["latitude"],
-            target_payload["longitude"],
-        )
+            connectors.append((source, target, f"{mode}-connector-{source}-{target}", payload))
+            connectors.append((target, source, f"{mode}-connector-{target}-{source}", payload))
+
+        graph.add_edges_from(connectors)
 
     def _annotate_bike_accessible_nodes(self) -> None:
-        """Mark nodes that are within reach of a registered bike parking."""
+        """Mark nodes that are within reach of a registered bike parking.
 
-        if not self._bike_parkings:
-            for graph in self._graphs.values():
-                nx.set_node_attributes(graph, False, "bike_accessible")
-            return
+        Accessibility is evaluated once per stop over the node coordinate arrays and kept
+        in ``_node_bike_accessible``; the node attribute is then set on every graph.
+        """
+
+        for mode in self._graphs:
+            self._mark_graph_changed(mode)
 
+        node_count = len(self._idx_to_node_id)
+        if self._parking_latitudes.size == 0:
+            accessible = np.zeros(node_count, dtype=bool)
+        else:
+            accessible = np.fromiter(
+                (
+                    any_within_radius(
+                        latitude,
+                        longitude,
+                        self._parking_latitudes,
+                        self._parking_longitudes,
+                        self._bike_access_radius_km,
+                    )
+                    for latitude, longitude in zip(
+                        self._node_latitudes.tolist(), self._node_longitudes.tolist()
+                    )
+                ),
+                dtype=bool,
+                count=node_count,
+            )
+        self._node_bike_accessible = accessible
+
+        accessibility = dict(zip(self._idx_to_node_id, accessible.tolist()))
         for graph in self._graphs.values():
-            accessibility: dict[str, bool] = {}
-            for node, attrs in graph.nodes(data=True):
-                accessibility[node] = self._is_within_bike_radius(attrs)
             nx.set_node_attributes(graph, accessibility, "bike_accessible")
 
     def _refresh_bike_graph(self) -> None:
@@ -739,83 +1098,155 @@ class TransportGraphService:
         if walking_graph is None:
             return
 
+        bike_graph = self._graphs.get("bike")
+        if bike_graph is not None:
+            # The bike graph mirrors the walking topology, so a refresh only changes the
+            # speed of edges whose endpoints gained or lost parking access. Speeds are
+            # derived from the cached edge arrays and written back for those edges only.
+            fast = self._bike_fast_edges()
+            changed = np.flatnonzero(
+                (fast != self._bike_edge_fast) & ~np.isnan(self._bike_edge_distances_km)
+            )
+            speeds = np.where(fast, self._bike_speed_kmh, self._walker_speed_kmh)
+            weights = self._bike_edge_distances_km * np.where(
+                fast, self._bike_seconds_per_km, self._walker_seconds_per_km
+            )
+
+            edge_index = bike_graph.graph["_edge_index"]
+            nx.set_edge_attributes(
+                bike_graph,
+                {
+                    edge_index[position]: {
+                        "speed_kmh": speed,
+                        "weight": weight,
+                        "default_weight": weight,
+                    }
+                    for position, speed, weight in zip(
+                        changed.tolist(), speeds[changed].tolist(), weights[changed].tolist()
+                    )
+                },
+            )
+            bike_graph.graph["_impacted"][changed] = False
+            bike_graph.graph["_default_weights"][changed] = weights[changed]
+            bike_graph.graph["_current_weights"][changed] = weights[changed]
+            min_edges = bike_graph.graph["_min_edge"]
+            for source, target in {edge_index[position][:2] for position in changed.tolist()}:
+                best = self._pick_default_edge(bike_graph[source][target])
+                if best is None:
+                    min_edges.pop((source, target), None)
+                else:
+                    min_edges[(source, target)] = best
+            self._record_weight_stats(bike_graph)
+            self._bike_edge_fast = fast
+            self._mark_graph_changed("bike")
+            return
+
         bike_graph = MultimodalDiGraph(mode="bike")
-        for node, attrs in walking_graph.nodes(data=True):
-            bike_graph.add_node(node, **attrs)
+        bike_graph.add_nodes_from(walking_graph.nodes(data=True))
 
+        bike_edges: list[tuple[str, str, str | int, dict[str, Any]]] = []
         for source, target, key, payload in walking_graph.edges(keys=True, data=True):
             updated_payload = dict(payload)
             updated_payload["mode"] = "bike"
 
             distance_km = payload.get("distance_km")
             if distance_km is not None:
-                if (
-                    bike_graph.nodes[source].get("bike_accessible")
-                    and bike_graph.nodes[target].get("bike_accessible")
-                ):
-                    speed = self._bike_speed_kmh
-                else:
-                    speed = self._walker_speed_kmh
+                speed, seconds_per_km = self._bike_edge_speed(source, target)
                 updated_payload["speed_kmh"] = speed
-                updated_payload["weight"] = self._travel_time_seconds(distance_km, speed)
+                updated_payload["weight"] = distance_km * seconds_per_km
                 updated_payload["default_weight"] = updated_payload["weight"]
 
             if "default_weight" not in updated_payload:
                 updated_payload["default_weight"] = updated_payload.get("weight")
 
-            bike_graph.add_edge(source, target, key=key, **updated_payload)
+            bike_edges.append((source, target, key, updated_payload))
 
-        self._ensure_connected(
-            bike_graph,
-            {node: {"latitude": data["latitude"], "longitude": data["longitude"]} for node, data in bike_graph.nodes(data=True)},
-            self._bike_speed_kmh,
-            mode="bike",
-        )
+        bike_graph.add_edges_from(bike_edges)
 
+        self._ensure_connected(bike_graph, self._bike_speed_kmh, mode="bike")
+
+        self._index_edges(bike_graph)
+        self._index_bike_edges(bike_graph)
         self._graphs["bike"] = bike_graph
+        self._mark_graph_changed("bike")
+
+    def _index_bike_edges(self, bike_graph: MultimodalDiGraph) -> None:
+        """Cache bike edge endpoints, distances and speed classes as parallel arrays."""
+
+        node_id_to_idx = self._node_id_to_idx
+        edge_index = bike_graph.graph["_edge_index"]
+        count = len(edge_index)
+        self._bike_edge_sources = np.fromiter(
+            (node_id_to_idx[source] for source, _, _ in edge_index), dtype=np.int32, count=count
+        )
+        self._bike_edge_targets = np.fromiter(
+            (node_id_to_idx[target] for _, target, _ in edge_index), dtype=np.int32, count=count
+        )
+        self._bike_edge_distances_km = np.fromiter(
+            (
+                np.nan if distance_km is None else distance_km
+                for _, _, distance_km in bike_graph.edges(data="distance_km")
+            ),
+            dtype=np.float64,
+            count=count,
+        )
+        self._bike_edge_fast = self._bike_fast_edges()
+
+    def _bike_fast_edges(self) -> np.ndarray:
+        """Return a mask of bike edges whose endpoints are both bike accessible."""
+
+        accessible = self._node_bike_accessible
+        return accessible[self._bike_edge_sources] & accessible[self._bike_edge_targets]
+
+    def _bike_edge_speed(self, source: str, target: str) -> tuple[float, float]:
+        """Return the speed and seconds-per-km factor for a bike graph edge."""
+
+        accessible = self._node_bike_accessible
+        node_id_to_idx = self._node_id_to_idx
+        if accessible[node_id_to_idx[source]] and accessible[node_id_to_idx[target]]:
+            return self._bike_speed_kmh, self._bike_seconds_per_km
+        return self._walker_speed_kmh, self._walker_seconds_per_km
 
     # ------------------------------------------------------------------
     # Public helpers for visualization
     # ------------------------------------------------------------------
 
-    def subscribe(self) -> Queue[dict[str, Any]]:
-        """Register a queue that will receive graph update events."""
+    def subscribe(self) -> SubscriberChannel:
+        """Register a channel that will receive graph update events."""
+
+        channel = SubscriberChannel(maxsize=128)
+        loop = self._running_loop()
+        if loop is not None:
+            self._subscriber_loop = loop
+        self._subscribers = (*self._subscribers, channel)
+        return channel
 
-        queue: Queue[dict[str, Any]] = Queue(maxsize=128)
-        with self._subscribers_lock:
-            self._subscribers.add(queue)
-        return queue
+    def unsubscribe(self, channel: SubscriberChannel) -> None:
+        """Remove a previously registered subscriber channel."""
 
-    def unsubscribe(self, queue: Queue[dict[str, Any]]) -> None:
-        """Remove a previously registered subscriber queue."""
+        self._subscribers = tuple(
+            subscriber for subscriber in self._subscribers if subscriber is not channel
+        )
 
-        with self._subscribers_lock:
-            self._subscribers.discard(queue)
+    def graph_snapshot(self, *, mode: str | None = None) -> dict[str, Mapping[str, Any]]:
+        """Serialize transport graphs for visualization clients.
 
-    def graph_snapshot(self, *, mode: str | None = None) -> dict[str, Any]:
-        """Serialize transport graphs for visualization clients."""
+        Each graph payload is a read-only view over the cached serialization.
+        """
 
         if mode is not None:
             graph = self.get_graph(mode)
-            return {mode: self._serialize_graph(graph)}
+            return {mode: self._cached_serialization(mode, graph)}
         return {
-            graph_mode: self._serialize_graph(graph)
+            graph_mode: self._cached_serialization(graph_mode, graph)
             for graph_mode, graph in self._graphs.items()
         }
 
-    def _is_within_bike_radius(self, node_attrs: dict[str, Any]) -> bool:
-        """Check if a node is within the configured radius of any bike parking."""
-
-        latitude = node_attrs.get("latitude")
-        longitude = node_attrs.get("longitude")
-        if latitude is None or longitude is None:
-            return False
+    def snapshot_message(self) -> dict[str, Any]:
+        """Build a JSON-ready snapshot event covering every graph."""
 
-        for parking in self._bike_parkings:
-            distance_km = self._haversine_km(latitude, longitude, parking.latitude, parking.longitude)
-            if distance_km <= self._bike_access_radius_km:
-                return True
-        return False
+        graphs = {mode: dict(payload) for mode, payload in self.graph_snapshot().items()}
+        return {"type": "snapshot", "graphs": graphs}
 
     @staticmethod
     def _travel_time_seconds(distance_km: float, speed_kmh: float) -> float:
@@ -834,77 +1265,161 @@ class TransportGraphService:
 
         if not self._subscribers:
             return
-        snapshot = self.graph_snapshot()
-        self._notify_subscribers({"type": "snapshot", "graphs": snapshot})
+        self._notify_subscribers(self.snapshot_message())
+
+    def _mark_graph_changed(self, mode: str) -> None:
+        """Bump the structural version of a graph so cached snapshots are rebuilt."""
+
+        self._graph_versions[mode] = self._graph_versions.get(mode, 0) + 1
+
+    def _cached_serialization(self, mode: str, graph: MultimodalDiGraph) -> Mapping[str, Any]:
+        """Return the serialized graph, reusing the cached payload while it is current.
+
+        The cached payload is shared between callers, so it is handed out as a
+        read-only view with ``nodes``/``edges`` stored as tuples. Updates never touch a
+        payload that was already handed out: ``_patch_cached_edge`` replaces it with a
+        patched copy. The node and edge dicts inside are shared as well and must not be
+        mutated by callers.
+        """
+
+        version = self._graph_versions.get(mode, 0)
+        cached = self._snapshot_cache.get(mode)
+        if cached is None or cached[0] != version:
+            cached = (version, self._serialize_graph(graph))
+            self._snapshot_cache[mode] = cached
+        return MappingProxyType(cached[1])
+
+    def _patch_cached_edge(
+        self,
+        mode: str,
+        graph: MultimodalDiGraph,
+        position: int | None,
+        source: str,
+        target: str,
+        key: str | int,
+    ) -> None:
+        """Re-serialize a single edge in the cached snapshot after an attribute update.
+
+        Edge positions follow ``graph.edges`` order, which matches the cached ``edges``
+        tuple. The patch is copy-on-write: the tuple of edge references is copied with one
+        slot replaced, so snapshots handed out earlier keep their original contents. If
+        the edge is not indexed or no current snapshot exists, the graph is marked as
+        changed so the next snapshot is rebuilt in full.
+        """
+
+        cached = self._snapshot_cache.get(mode)
+        if (
+            position is None
+            or cached is None
+            or cached[0] != self._graph_versions.get(mode, 0)
+        ):
+            self._mark_graph_changed(mode)
+            return
+
+        version, payload = cached
+        edges = list(payload["edges"])
+        edges[position] = self._serialize_edge(
+            source, target, key, graph[source][target][key], graph.graph.get("mode")
+        )
+        self._snapshot_cache[mode] = (version, {**payload, "edges": tuple(edges)})
 
     def _serialize_graph(self, graph: MultimodalDiGraph) -> dict[str, Any]:
         """Convert a graph to serializable node and edge collections."""
 
-        nodes_payload: list[dict[str, Any]] = []
-        for node_id, attrs in graph.nodes(data=True):
+        graph_mode = graph.graph.get("mode")
+
+        nodes_payload: list[dict[str, Any] | None] = [None] * graph.number_of_nodes()
+        for index, (node_id, attrs) in enumerate(graph.nodes(data=True)):
+            # Core fields are popped off a single copy; whatever remains is metadata.
+            metadata = attrs.copy()
             node_entry = {
                 "id": node_id,
-                "latitude": attrs.get("latitude"),
-                "longitude": attrs.get("longitude"),
-                "bike_accessible": attrs.get("bike_accessible"),
-                "stop_name": attrs.get("stop_name"),
-            }
-            metadata = {
-                key: value
-                for key, value in attrs.items()
-                if key not in {"latitude", "longitude", "bike_accessible", "stop_name"}
+                "latitude": metadata.pop("latitude", None),
+                "longitude": metadata.pop("longitude", None),
+                "bike_accessible": metadata.pop("bike_accessible", None),
+                "stop_name": metadata.pop("stop_name", None),
             }
             if metadata:
                 node_entry["metadata"] = metadata
-            nodes_payload.append(node_entry)
+            nodes_payload[index] = node_entry
 
-        edges_payload: list[dict[str, Any]] = []
-        for source, target, key, attrs in graph.edges(keys=True, data=True):
-            edge_entry = {
-                "source": source,
-                "target": target,
-                "key": key,
-                "weight": attrs.get("weight"),
-                "mode": attrs.get("mode", graph.graph.get("mode")),
-                "distance_km": attrs.get("distance_km"),
-                "speed_kmh": attrs.get("speed_kmh"),
-                "connector": attrs.get("connector"),
-            }
-            metadata = {
-                edge_key: value
-                for edge_key, value in attrs.items()
-                if edge_key not in {"weight", "mode", "distance_km", "speed_kmh", "connector"}
-            }
-            if metadata:
-                edge_entry["metadata"] = metadata
-            edges_payload.append(edge_entry)
+        edges_payload: list[dict[str, Any] | None] = [None] * graph.number_of_edges()
+        serialize_edge = self._serialize_edge
+        for index, (source, target, key, attrs) in enumerate(
+            graph.edges(keys=True, data=True)
+        ):
+            edges_payload[index] = serialize_edge(source, target, key, attrs, graph_mode)
 
         return {
-            "mode": graph.graph.get("mode"),
-            "nodes": nodes_payload,
-            "edges": edges_payload,
+            "mode": graph_mode,
+            "nodes": tuple(nodes_payload),
+            "edges": tuple(edges_payload),
         }
 
+    @staticmethod
+    def _serialize_edge(
+        source: str,
+        target: str,
+        key: str | int,
+        attrs: dict[str, Any],
+        graph_mode: str | None,
+    ) -> dict[str, Any]:
+        """Convert a single edge to its snapshot entry."""
+
+        metadata = attrs.copy()
+        edge_entry = {
+            "source": source,
+            "target": target,
+            "key": key,
+            "weight": metadata.pop("weight", None),
+            "mode": metadata.pop("mode", graph_mode),
+            "distance_km": metadata.pop("distance_km", None),
+            "speed_kmh": metadata.pop("speed_kmh", None),
+            "connector": metadata.pop("connector", None),
+        }
+        if metadata:
+            edge_entry["metadata"] = metadata
+        return edge_entry
+
     def _notify_subscribers(self, event: dict[str, Any]) -> None:
-        """Push an event to all registered subscriber queues."""
+        """Push an event to all registered subscriber channels.
+
+        Subscriber channels are only touched from the event loop that registered them, so no
+        lock is needed; calls made from worker threads are handed over to that loop.
+        """
 
         if not self._subscribers:
             return
 
-        with self._subscribers_lock:
-            subscribers = list(self._subscribers)
+        loop = self._subscriber_loop
+        if loop is not None and self._running_loop() is not loop:
+            loop.call_soon_threadsafe(self._deliver_event, event)
+            return
+        self._deliver_event(event)
 
-        for queue in subscribers:
-            try:
-                queue.put_nowait(event)
-            except QueueFull:
-                with suppress(QueueEmpty):
-                    queue.get_nowait()
-                with suppress(QueueFull):
-                    queue.put_nowait(event)
+    @staticmethod
+    def _running_loop() -> asyncio.AbstractEventLoop | None:
+        """Return the event loop running in the current thread, if any."""
+
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    def _deliver_event(self, event: dict[str, Any]) -> None:
+        """Put an event on every subscriber channel."""
+
+        for channel in self._subscribers:
+            channel.put(event)
 
     def _resolve_feed_path(self) -> Path:
-        """Return an absolute path to the configured GTFS feed file."""
+        """Return an absolute path to the configured GTFS feed file.
+
+        The path is resolved and checked once; later calls reuse the cached result.
+        """
+
+        if self._resolved_feed_path is not None:
+            return self._resolved_feed_path
 
         feed_path = self._feed_path
         if not feed_path.is_absolute():
@@ -912,28 +1427,53 @@ class TransportGraphService:
         if not feed_path.exists():
             msg = f"GTFS feed not found at '{feed_path}'."
             raise FileNotFoundError(msg)
+        self._resolved_feed_path = feed_path
         return feed_path
 
     @staticmethod
     def _time_to_seconds(series: pd.Series) -> pd.Series:
-        """Convert GTFS HH:MM:SS strings to seconds."""
-
-        return pd.to_timedelta(series).dt.total_seconds()
-
-    @staticmethod
-    def _haversine_km(
-        lat1: float,
-        lon1: float,
-        lat2: float,
-        lon2: float,
-    ) -> float:
-        """Great-circle distance between two lat/lon pairs in kilometres."""
-
-        radius_earth_km = 6371.0
-        dlat = radians(lat2 - lat1)
-        dlon = radians(lon2 - lon1)
-        a = (
-            sin(dlat / 2) ** 2
-            + cos(radians(lat1)) * cos(radians(lat2)) * sin(dlon / 2) ** 2
+        """Convert GTFS HH:MM:SS strings to seconds.
+
+        Zero-padded ``HH:MM:SS`` values (including hours past midnight) are decoded
+        directly from their code points; any other format falls back to pandas parsing,
+        truncated to whole seconds like GTFS times. Missing values become NaN.
+        """
+
+        values = series.to_numpy(dtype=object)
+        seconds = np.full(values.shape[0], np.nan)
+        present = np.flatnonzero(pd.notna(values))
+        if present.size == 0:
+            return pd.Series(seconds, index=series.index)
+
+        strings = values[present].astype(str)
+        fixed = np.char.str_len(strings) == 8
+        # Code points minus ord("0") wrap around for characters below "0", so a single
+        # unsigned comparison validates every digit column.
+        digits = strings[fixed].astype("U8").view(np.uint32).reshape(-1, 8) - ord("0")
+        separator_columns = np.array([False, False, True, False, False, True, False, False])
+        well_formed = (
+            ((digits < 10) != separator_columns).all(axis=1)
+            & (digits[:, 2] == ord(":") - ord("0"))
+            & (digits[:, 5] == ord(":") - ord("0"))
         )
-        return 2 * radius_earth_km * asin(sqrt(a))
+        fixed[fixed] = well_formed
+        # Stays in uint32: even "99:99:99" is far below 2**32, so no widening copy.
+        digits = digits[well_formed]
+        seconds[present[fixed]] = (
+            (digits[:, 0] * 10 + digits[:, 1]) * 3600
+            + (digits[:, 3] * 10 + digits[:, 4]) * 60
+            + digits[:, 6] * 10
+            + digits[:, 7]
+        )
+
+        irregular = ~fixed
+        if irregular.any():
+            whole_seconds = (
+                pd.to_timedelta(pd.Series(strings[irregular]))
+                .to_numpy()
+                .astype("timedelta64[s]")
+            )
+            seconds[present[irregular]] = np.where(
+                np.isnat(whole_seconds), np.nan, whole_seconds.view(np.int64)
+            )
+        return pd.Series(seconds, index=series.index)
@@ -0,0 +1,174 @@
+"""Geodesic helper kernels shared by the transport services."""
+
+from __future__ import annotations
+
+from math import asin, cos, radians, sin, sqrt
+
+import numpy as np
+
+try:  # Numba is an optional accelerator; the NumPy path is used without it.
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = None
+    prange = range
+
+EARTH_RADIUS_KM = 6371.0
+
+
+def distances_from_point_km(
+    latitude: float,
+    longitude: float,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+) -> np.ndarray:
+    """Great-circle distances from one location to arrays of points in kilometres.
+
+    Args:
+        latitude: Latitude of the reference location in degrees.
+        longitude: Longitude of the reference location in degrees.
+        latitudes: Candidate latitudes in degrees.
+        longitudes: Candidate longitudes in degrees.
+
+    Returns:
+        Array of distances in kilometres, aligned with ``latitudes``.
+    """
+
+    dlat = np.radians(latitudes - latitude)
+    dlon = np.radians(longitudes - longitude)
+    a = (
+        np.sin(dlat / 2) ** 2
+        + cos(radians(latitude)) * np.cos(np.radians(latitudes)) * np.sin(dlon / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+def _any_within_radius_loop(
+    latitude: float,
+    longitude: float,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+    radius_km: float,
+) -> bool:
+    """Scalar haversine scan that stops at the first point inside ``radius_km``."""
+
+    cos_latitude = cos(radians(latitude))
+    for index in range(latitudes.shape[0]):
+        dlat = radians(latitudes[index] - latitude)
+        dlon = radians(longitudes[index] - longitude)
+        a = sin(dlat / 2) ** 2 + cos_latitude * cos(radians(latitudes[index])) * sin(dlon / 2) ** 2
+        if 2 * EARTH_RADIUS_KM * asin(sqrt(a)) <= radius_km:
+            return True
+    return False
+
+
+def _any_within_radius_numpy(
+    latitude: float,
+    longitude: float,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+    radius_km: float,
+) -> bool:
+    """Vectorised haversine check used when Numba is not installed."""
+
+    distances = distances_from_point_km(latitude, longitude, latitudes, longitudes)
+    return bool((distances <= radius_km).any())
+
+
+if njit is not None:
+    _any_within_radius_impl = njit(cache=True, nogil=True)(_any_within_radius_loop)
+else:
+    _any_within_radius_impl = _any_within_radius_numpy
+
+
+def any_within_radius(
+    latitude: float,
+    longitude: float,
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+    radius_km: float,
+) -> bool:
+    """Check whether any of the given points lies within ``radius_km`` of a location.
+
+    Args:
+        latitude: Latitude of the reference location in degrees.
+        longitude: Longitude of the reference location in degrees.
+        latitudes: Contiguous ``float64`` array of candidate latitudes.
+        longitudes: Contiguous ``float64`` array of candidate longitudes.
+        radius_km: Search radius in kilometres.
+
+    Returns:
+        ``True`` if at least one candidate is within the radius.
+    """
+
+    return bool(
+        _any_within_radius_impl(
+            float(latitude), float(longitude), latitudes, longitudes, float(radius_km)
+        )
+    )
+
+
+def _edge_distances_loop(
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+    sources: np.ndarray,
+    targets: np.ndarray,
+) -> np.ndarray:
+    """Fused per-edge haversine over node coordinate arrays."""
+
+    distances = np.empty(sources.shape[0], dtype=np.float64)
+    for index in prange(sources.shape[0]):
+        source_lat = latitudes[sources[index]]
+        target_lat = latitudes[targets[index]]
+        dlat = radians(target_lat - source_lat)
+        dlon = radians(longitudes[targets[index]] - longitudes[sources[index]])
+        a = (
+            sin(dlat / 2) ** 2
+            + cos(radians(source_lat)) * cos(radians(target_lat)) * sin(dlon / 2) ** 2
+        )
+        distances[index] = 2 * EARTH_RADIUS_KM * asin(sqrt(a))
+    return distances
+
+
+def _edge_distances_numpy(
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+    sources: np.ndarray,
+    targets: np.ndarray,
+) -> np.ndarray:
+    """Vectorised per-edge haversine used when Numba is not installed."""
+
+    source_lats = latitudes[sources]
+    target_lats = latitudes[targets]
+    dlat = np.radians(target_lats - source_lats)
+    dlon = np.radians(longitudes[targets] - longitudes[sources])
+    a = (
+        np.sin(dlat / 2) ** 2
+        + np.cos(np.radians(source_lats)) * np.cos(np.radians(target_lats)) * np.sin(dlon / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+if njit is not None:
+    _edge_distances_impl = njit(cache=True, parallel=True)(_edge_distances_loop)
+else:
+    _edge_distances_impl = _edge_distances_numpy
+
+
+def edge_distances_km(
+    latitudes: np.ndarray,
+    longitudes: np.ndarray,
+    sources: np.ndarray,
+    targets: np.ndarray,
+) -> np.ndarray:
+    """Compute great-circle lengths for a list of edges in one pass.
+
+    Args:
+        latitudes: Node latitudes in degrees, indexed by node index.
+        longitudes: Node longitudes in degrees, indexed by node index.
+        sources: Integer node indices of the edge sources.
+        targets: Integer node indices of the edge targets.
+
+    Returns:
+        Array of edge lengths in kilometres, aligned with ``sources``.
+    """
+
+    return _edge_distances_impl(latitudes, longitudes, sources, targets)
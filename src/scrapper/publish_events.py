@@ -1,21 +1,108 @@
-import json
+import asyncio
+import logging
+from collections.abc import Iterable, Iterator
+
+import aiohttp
+import ijson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Retry policy shared by the sync and async publishers. POST is not idempotent, so only
+# connection failures are retried and events are never published twice.
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.2
+
+# One keep-alive connection pool for all events.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+        ),
+    ),
+)
+
+logger = logging.getLogger("publisher")
+
+INCIDENTS_URL = "http://localhost:8000/api/v1/incidents/"
+MAX_CONCURRENCY = 32
+QUEUE_SIZE = 256
 
 def publish_event(event: dict):
-    url = "http://localhost:8000/api/v1/incidents/"
-    response = requests.post(url, json=event)
+    response = _SESSION.post(INCIDENTS_URL, json=event, timeout=10)
     if response.status_code == 201:
-        print(f"✅ Event published successfully: {response.json()}")
+        logger.info("✅ Event published successfully: %s", response.json())
     else:
-        print(f"❌ Failed to publish event: {response.status_code}, {response.text}")
+        logger.warning("❌ Failed to publish event: %s, %s", response.status_code, response.text)
     return response.status_code == 201
 
-def publish_events(events: list[dict]):
-    for event in events:
-        publish_event(event)
-    print(f"Published {len(events)} events.")
+def iter_events(path: str) -> Iterator[dict]:
+    # Streams the JSON array item by item instead of loading the whole file.
+    with open(path, "rb") as f:
+        yield from ijson.items(f, "item", use_float=True)
+
+async def _post_event(session: aiohttp.ClientSession, event: dict) -> bool:
+    # Mirrors the urllib3 policy of publish_event: only failures to connect are retried,
+    # so a request that reached the server is never sent twice.
+    for attempt in range(RETRY_TOTAL + 1):
+        try:
+            async with session.post(INCIDENTS_URL, json=event) as response:
+                if response.status == 201:
+                    logger.info("✅ Event published successfully: %s", await response.json())
+                    return True
+                logger.warning(
+                    "❌ Failed to publish event: %s, %s", response.status, await response.text()
+                )
+                return False
+        except aiohttp.ClientConnectorError:
+            if attempt == RETRY_TOTAL:
+                raise
+            await asyncio.sleep(RETRY_BACKOFF_FACTOR * 2**attempt)
+    return False
+
+async def _publish_one(session: aiohttp.ClientSession, event: dict) -> bool:
+    # Errors are recorded per event so one bad request never aborts the whole batch.
+    try:
+        return await _post_event(session, event)
+    except Exception:
+        logger.exception("❌ Failed to publish event: %s", event)
+        return False
+
+async def _publish_worker(
+    session: aiohttp.ClientSession,
+    queue: asyncio.Queue[tuple[int, dict] | None],
+    results: dict[int, bool],
+) -> None:
+    while (item := await queue.get()) is not None:
+        index, event = item
+        results[index] = await _publish_one(session, event)
+
+async def publish_events_async(events: Iterable[dict]) -> list[bool]:
+    # A bounded queue lets the producer keep reading events while earlier ones are sent,
+    # without ever holding more than QUEUE_SIZE of them in memory.
+    queue: asyncio.Queue[tuple[int, dict] | None] = asyncio.Queue(maxsize=QUEUE_SIZE)
+    results: dict[int, bool] = {}
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=MAX_CONCURRENCY),
+        timeout=aiohttp.ClientTimeout(total=10),
+    ) as session, asyncio.TaskGroup() as workers:
+        for _ in range(MAX_CONCURRENCY):
+            workers.create_task(_publish_worker(session, queue, results))
+        for item in enumerate(events):
+            await queue.put(item)
+        for _ in range(MAX_CONCURRENCY):
+            await queue.put(None)
+    logger.info("Published %d events.", len(results))
+    return [results[index] for index in range(len(results))]
+
+def publish_events(events: Iterable[dict]):
+    return asyncio.run(publish_events_async(events))
 
 if __name__ == "__main__":
-    with open("parsed_posts.json", "r", encoding="utf-8") as f:
-        events = json.load(f)
-    publish_events(events)
\ No newline at end of file
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    publish_events(iter_events("parsed_posts.json"))
\ No newline at end of file
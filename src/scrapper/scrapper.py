@@ -1,33 +1,63 @@
-import json
+import os
+from functools import lru_cache
+
 import pandas as pd
-from difflib import get_close_matches
+from rapidfuzz import fuzz, process
 from openai import OpenAI
-import os, json
 from dotenv import load_dotenv
-import json
 
 load_dotenv()
 client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-stops = pd.read_csv("stops_deduped.csv")
 
-def generate_prompt(text: str) -> str:
-    return f"""Analyze the transport alert below and return only valid JSON with:
+_PROMPT_PREFIX = """Analyze the transport alert below and return only valid JSON with:
     - "description": under 5 words summarizing what happened in Polish,
     - "category": "incident" (accident, crash, obstruction) or "traffic" (delay, congestion),
     - "loc": most likely cracovian stop name (stop, street, or area).
     If info missing, use null.
-    Text: {text}"""
-
-def find_stop(query: str, stops_df: pd.DataFrame):
-    names = stops_df["stop_name"].tolist()
-    match = get_close_matches(query, names, n=1, cutoff=0.4)
-    if match:
-        stop = stops_df[stops_df["stop_name"] == match[0]].iloc[0]
-        return {
-            "matched_name": stop["stop_name"],
-            "latitude": stop["stop_lat"],
-            "longitude": stop["stop_lon"]
-        }
-    else:
+    Text: """
+
+@lru_cache(maxsize=1)
+def _stops() -> pd.DataFrame:
+    return pd.read_csv("stops_deduped.csv")
+
+def __getattr__(name: str):
+    # Keeps the public ``stops`` table available, loaded on first access.
+    if name == "stops":
+        return _stops()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+@lru_cache(maxsize=1)
+def _stop_table():
+    stops = _stops()
+    return (
+        stops["stop_name"].tolist(),
+        stops["stop_lat"].to_numpy(),
+        stops["stop_lon"].to_numpy(),
+    )
+
+def generate_prompt(text: str) -> str:
+    return _PROMPT_PREFIX + text
+
+def _stop_columns(stops_df: pd.DataFrame | None):
+    if stops_df is None:
+        return _stop_table()
+    return (
+        stops_df["stop_name"].tolist(),
+        stops_df["stop_lat"].to_numpy(),
+        stops_df["stop_lon"].to_numpy(),
+    )
+
+def _best_match_index(query: str, names: list[str]):
+    match = process.extractOne(query, names, scorer=fuzz.WRatio, score_cutoff=40)
+    return None if match is None else match[2]
+
+def find_stop(query: str, stops_df: pd.DataFrame | None = None):
+    names, latitudes, longitudes = _stop_columns(stops_df)
+    index = _best_match_index(query, names)
+    if index is None:
         return None
-    
+    return {
+        "matched_name": names[index],
+        "latitude": latitudes[index],
+        "longitude": longitudes[index]
+    }
@@ -3,7 +3,7 @@
 
 This script validates that incidents with insufficient social score do not affect
 transport edge weights until they receive administrative approval. It uses the public
-HTTP API via the ``requests`` library and assumes the FastAPI service is already
+HTTP API through a shared ``httpx`` client and assumes the FastAPI service is already
 running with transport graphs built during startup.
 
 Scenario covered:
@@ -22,22 +22,26 @@ Environment variables:
                              Kraków sample data).
     INCIDENT_WAIT_SECONDS    Maximum time in seconds to wait for the background incident
                              poller to process updates (default 90 seconds).
-    INCIDENT_POLL_CHECK      Polling interval in seconds while waiting for graph updates
-                             (default 3 seconds).
+    INCIDENT_POLL_CHECK      Maximum polling interval in seconds while waiting for graph
+                             updates; polls start at 0.1 seconds and back off
+                             exponentially up to this cap (default 3 seconds).
 
 The script exits with code 0 on success and raises exceptions when expectations are not
-met. It also prints progress messages for easier manual verification.
+met. It also logs progress messages for easier manual verification.
 """
 
 from __future__ import annotations
 
-import json
+import logging
+import math
 import os
 import sys
 import time
 from typing import Any, Callable
 
-import requests
+import orjson
+
+from incident_http import JSON_HEADERS, http_client, parse_json
 
 
 BASE_URL = os.getenv("BASE_URL", "http://localhost:8000").rstrip("/")
@@ -52,12 +56,9 @@ TEST_LONGITUDE = float(os.getenv("TEST_LONG", "19.938"))
 WAIT_TIMEOUT_SECONDS = float(os.getenv("INCIDENT_WAIT_SECONDS", "90"))
 WAIT_INTERVAL_SECONDS = float(os.getenv("INCIDENT_POLL_CHECK", "3"))
 BACKGROUND_POLL_SECONDS = float(os.getenv("INCIDENT_POLL_INTERVAL_SECONDS", "60"))
+INITIAL_POLL_DELAY_SECONDS = 0.1
 
-
-def _parse_json(response: requests.Response) -> dict[str, Any]:
-    """Parse JSON payloads while supporting Infinity returned by the API."""
-
-    return json.loads(response.text, parse_constant=lambda value: float(value))
+logger = logging.getLogger(__name__)
 
 
 def _check_server() -> None:
@@ -65,7 +66,7 @@ def _check_server() -> None:
 
     docs_url = f"{BASE_URL}/docs"
     try:
-        response = requests.get(docs_url, timeout=10)
+        response = http_client.get(docs_url, timeout=10)
         response.raise_for_status()
     except Exception as exc:  # pragma: no cover - script-level guardrail
         raise RuntimeError(
@@ -77,26 +78,27 @@ def _check_server() -> None:
 def _purge_incidents() -> None:
     """Remove all incidents via the admin API."""
 
-    response = requests.delete(
-        ADMIN_DELETE_ENDPOINT,
-        json={},
-        headers={"Accept": "application/json"},
-        timeout=30,
+    response = http_client.request(
+        "DELETE", ADMIN_DELETE_ENDPOINT, content=b"{}", headers=JSON_HEADERS
     )
     response.raise_for_status()
-    payload = _parse_json(response)
+    payload = parse_json(response)
     deleted = payload.get("deleted")
-    print(f"🧹 Purged incidents (deleted={deleted}).")
+    logger.info("🧹 Purged incidents (deleted=%s).", deleted)
 
 
 def _report_incident(payload: dict[str, Any]) -> str:
     """Report a single incident using the public API and return its ID."""
 
-    response = requests.post(INCIDENT_ENDPOINT, json=payload, timeout=30)
+    response = http_client.post(
+        INCIDENT_ENDPOINT, content=orjson.dumps(payload), headers=JSON_HEADERS
+    )
     response.raise_for_status()
-    data = response.json()
+    data = parse_json(response)
     incident_id = data.get("incident_id")
-    print(f"   → Incident stored with id={incident_id} (category={payload['category']}).")
+    logger.info(
+        "   → Incident stored with id=%s (category=%s).", incident_id, payload["category"]
+    )
     return incident_id
 
 
@@ -104,13 +106,13 @@ def _approve_incident(incident_id: str) -> None:
     """Approve an incident via the admin API endpoint."""
 
     approve_url = f"{ADMIN_APPROVE_ENDPOINT}/{incident_id}/approve"
-    response = requests.post(approve_url, timeout=30, allow_redirects=False)
+    response = http_client.post(approve_url, follow_redirects=False)
     
     # The endpoint returns a redirect (303), which is expected
     if response.status_code not in (303, 200):
         response.raise_for_status()
     
-    print(f"   ✓ Incident {incident_id} approved via admin API.")
+    logger.info("   ✓ Incident %s approved via admin API.", incident_id)
 
 
 def _lookup_edge() -> dict[str, Any]:
@@ -120,9 +122,11 @@ def _lookup_edge() -> dict[str, Any]:
         "latitude": TEST_LATITUDE,
         "longitude": TEST_LONGITUDE,
     }
-    response = requests.post(LOOKUP_ENDPOINT, json=payload, timeout=30)
+    response = http_client.post(
+        LOOKUP_ENDPOINT, content=orjson.dumps(payload), headers=JSON_HEADERS
+    )
     response.raise_for_status()
-    data = _parse_json(response)
+    data = parse_json(response)
     return data["edge"]
 
 
@@ -133,40 +137,54 @@ def _wait_for_condition(
     timeout: float = WAIT_TIMEOUT_SECONDS,
     interval: float = WAIT_INTERVAL_SECONDS,
 ) -> dict[str, Any]:
-    """Poll the nearest-edge lookup until the predicate succeeds or times out."""
+    """Poll the nearest-edge lookup until the predicate succeeds or times out.
+
+    The delay between polls starts at ``INITIAL_POLL_DELAY_SECONDS`` and doubles up to
+    ``interval``, so quick transitions are observed promptly while slow ones are not
+    hammered with requests.
+    """
 
     deadline = time.perf_counter() + timeout
     last_edge: dict[str, Any] | None = None
+    delay = min(INITIAL_POLL_DELAY_SECONDS, interval)
 
-    while time.perf_counter() < deadline:
+    while (remaining := deadline - time.perf_counter()) > 0:
         edge = _lookup_edge()
         last_edge = edge
         if predicate(edge):
-            print(f"✅ {description}")
+            logger.info("✅ %s", description)
             return edge
-        time.sleep(interval)
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, interval)
 
     raise TimeoutError(f"Timed out waiting for condition: {description}; last edge={last_edge}")
 
 
 def _approx_equal(value: float, reference: float, *, tolerance: float = 1e-3) -> bool:
-    """Return True when value is approximately reference within tolerance."""
+    """Return True when value is approximately reference within tolerance.
+
+    ``tolerance`` acts both as a relative tolerance and as an absolute floor for small
+    references.
+    """
 
-    return abs(value - reference) <= tolerance * max(1.0, abs(reference))
+    return math.isclose(value, reference, rel_tol=tolerance, abs_tol=tolerance)
 
 
 def scenario_approval_workflow() -> None:
     """Validate that low-score incidents only affect edges after approval."""
 
-    print("\n🧪 Scenario – Incident approval workflow (low social score)")
+    logger.info("🧪 Scenario – Incident approval workflow (low social score)")
     _purge_incidents()
 
     baseline_edge = _lookup_edge()
     baseline_weight = baseline_edge["weight"]
-    print(
-        f"Baseline edge: mode={baseline_edge['mode']} source={baseline_edge['source']} "
-        f"target={baseline_edge['target']} key={baseline_edge['key']} "
-        f"weight={baseline_weight:.2f}"
+    logger.info(
+        "Baseline edge: mode=%s source=%s target=%s key=%s weight=%.2f",
+        baseline_edge["mode"],
+        baseline_edge["source"],
+        baseline_edge["target"],
+        baseline_edge["key"],
+        baseline_weight,
     )
 
     # Step 1: Report an incident with low social score (below threshold of 50.0)
@@ -180,12 +198,12 @@ def scenario_approval_workflow() -> None:
         "reporter_social_score": 10.0,  # Well below threshold of 50.0
     }
 
-    print("Step 1: Submitting incident with low social score (10.0 < 50.0 threshold)...")
+    logger.info("Step 1: Submitting incident with low social score (10.0 < 50.0 threshold)...")
     incident_id = _report_incident(low_score_incident)
 
     # Wait for background poller to process the incident
     poll_wait = BACKGROUND_POLL_SECONDS + WAIT_INTERVAL_SECONDS
-    print(f"Waiting {poll_wait:.1f}s to allow background poller to process incident...")
+    logger.info("Waiting %.1fs to allow background poller to process incident...", poll_wait)
     time.sleep(poll_wait)
 
     # Step 2: Verify edge weight is unchanged (social score below threshold)
@@ -198,11 +216,11 @@ def scenario_approval_workflow() -> None:
     )
 
     # Step 3: Approve the incident via admin API
-    print("\nStep 2: Approving the incident via admin API...")
+    logger.info("Step 2: Approving the incident via admin API...")
     _approve_incident(incident_id)
 
     # Wait for background poller to apply the approval
-    print(f"Waiting {poll_wait:.1f}s for background poller to apply approval...")
+    logger.info("Waiting %.1fs for background poller to apply approval...", poll_wait)
     time.sleep(poll_wait)
 
     # Step 4: Verify edge weight is now modified (approved incident applies multiplier)
@@ -216,12 +234,13 @@ def scenario_approval_workflow() -> None:
         description="Edge weight scaled by Traffic multiplier (1.5) after approval",
     )
 
-    print(
-        f"Edge weight after approval: "
-        f"{updated_edge['weight']:.2f} (expected ≈{target_weight:.2f})"
+    logger.info(
+        "Edge weight after approval: %.2f (expected ≈%.2f)",
+        updated_edge["weight"],
+        target_weight,
     )
-    print(
-        "\n✨ Approval workflow validated: low-score incident had no effect until "
+    logger.info(
+        "✨ Approval workflow validated: low-score incident had no effect until "
         "approved, then immediately applied its multiplier."
     )
 
@@ -229,20 +248,22 @@ def scenario_approval_workflow() -> None:
 def main() -> None:
     """Execute the approval workflow integration scenario."""
 
-    print("=== Incident Approval Workflow Test ===")
-    print(f"Base URL: {BASE_URL}")
-    print(f"Coordinates: ({TEST_LATITUDE}, {TEST_LONGITUDE})")
+    logger.info("=== Incident Approval Workflow Test ===")
+    logger.info("Base URL: %s", BASE_URL)
+    logger.info("Coordinates: (%s, %s)", TEST_LATITUDE, TEST_LONGITUDE)
 
     _check_server()
     scenario_approval_workflow()
 
-    print("\n🎉 Approval workflow scenario completed successfully.")
+    logger.info("🎉 Approval workflow scenario completed successfully.")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("httpx").setLevel(logging.WARNING)
     try:
         main()
     except Exception as error:  # pragma: no cover - script entry point guard
-        print(f"❌ Scenario execution failed: {error}")
+        logger.error("❌ Scenario execution failed: %s", error)
         sys.exit(1)
 
@@ -3,8 +3,8 @@
 
 This script mirrors the style of ``test_nearest_edge_workflow.py`` but focuses on
 evaluating how incidents influence transport edge weights. It uses the public HTTP API
-via the ``requests`` library and assumes the FastAPI service is already running and has
-built its transport graphs during startup.
+through a shared ``httpx`` client and assumes the FastAPI service is already running and
+has built its transport graphs during startup.
 
 Two scenarios are covered:
 1. Multiple unapproved ``Traffic`` incidents are reported but remain below the acceptance
@@ -24,23 +24,26 @@ Environment variables:
                              Kraków sample data).
     INCIDENT_WAIT_SECONDS    Maximum time in seconds to wait for the background incident
                              poller to process updates (default 90 seconds).
-    INCIDENT_POLL_CHECK      Polling interval in seconds while waiting for graph updates
-                             (default 3 seconds).
+    INCIDENT_POLL_CHECK      Maximum polling interval in seconds while waiting for graph
+                             updates; polls start at 0.1 seconds and back off
+                             exponentially up to this cap (default 3 seconds).
 
 The script exits with code 0 on success and raises exceptions when expectations are not
-met. It also prints progress messages for easier manual verification.
+met. It also logs progress messages for easier manual verification.
 """
 
 from __future__ import annotations
 
-import json
+import logging
 import math
 import os
 import sys
 import time
 from typing import Any, Callable, Dict
 
-import requests
+import orjson
+
+from incident_http import JSON_HEADERS, http_client, parse_json
 
 
 BASE_URL = os.getenv("BASE_URL", "http://localhost:8000").rstrip("/")
@@ -54,12 +57,9 @@ TEST_LONGITUDE = float(os.getenv("TEST_LONG", "19.938"))
 WAIT_TIMEOUT_SECONDS = float(os.getenv("INCIDENT_WAIT_SECONDS", "90"))
 WAIT_INTERVAL_SECONDS = float(os.getenv("INCIDENT_POLL_CHECK", "3"))
 BACKGROUND_POLL_SECONDS = float(os.getenv("INCIDENT_POLL_INTERVAL_SECONDS", "60"))
+INITIAL_POLL_DELAY_SECONDS = 0.1
 
-
-def _parse_json(response: requests.Response) -> Dict[str, Any]:
-    """Parse JSON payloads while supporting Infinity returned by the API."""
-
-    return json.loads(response.text, parse_constant=lambda value: float(value))
+logger = logging.getLogger(__name__)
 
 
 def _check_server() -> None:
@@ -67,7 +67,7 @@ def _check_server() -> None:
 
     docs_url = f"{BASE_URL}/docs"
     try:
-        response = requests.get(docs_url, timeout=10)
+        response = http_client.get(docs_url, timeout=10)
         response.raise_for_status()
     except Exception as exc:  # pragma: no cover - script-level guardrail
         raise RuntimeError(
@@ -79,26 +79,27 @@ def _check_server() -> None:
 def _purge_incidents() -> None:
     """Remove all incidents via the admin API."""
 
-    response = requests.delete(
-        ADMIN_DELETE_ENDPOINT,
-        json={},
-        headers={"Accept": "application/json"},
-        timeout=30,
+    response = http_client.request(
+        "DELETE", ADMIN_DELETE_ENDPOINT, content=b"{}", headers=JSON_HEADERS
     )
     response.raise_for_status()
-    payload = _parse_json(response)
+    payload = parse_json(response)
     deleted = payload.get("deleted")
-    print(f"🧹 Purged incidents (deleted={deleted}).")
+    logger.info("🧹 Purged incidents (deleted=%s).", deleted)
 
 
 def _report_incident(payload: Dict[str, Any]) -> None:
     """Report a single incident using the public API."""
 
-    response = requests.post(INCIDENT_ENDPOINT, json=payload, timeout=30)
+    response = http_client.post(
+        INCIDENT_ENDPOINT, content=orjson.dumps(payload), headers=JSON_HEADERS
+    )
     response.raise_for_status()
-    data = response.json()
+    data = parse_json(response)
     incident_id = data.get("incident_id")
-    print(f"   → Incident stored with id={incident_id} (category={payload['category']}).")
+    logger.info(
+        "   → Incident stored with id=%s (category=%s).", incident_id, payload["category"]
+    )
 
 
 def _lookup_edge() -> Dict[str, Any]:
@@ -108,9 +109,11 @@ def _lookup_edge() -> Dict[str, Any]:
         "latitude": TEST_LATITUDE,
         "longitude": TEST_LONGITUDE,
     }
-    response = requests.post(LOOKUP_ENDPOINT, json=payload, timeout=30)
+    response = http_client.post(
+        LOOKUP_ENDPOINT, content=orjson.dumps(payload), headers=JSON_HEADERS
+    )
     response.raise_for_status()
-    data = _parse_json(response)
+    data = parse_json(response)
     return data["edge"]
 
 
@@ -121,40 +124,54 @@ def _wait_for_condition(
     timeout: float = WAIT_TIMEOUT_SECONDS,
     interval: float = WAIT_INTERVAL_SECONDS,
 ) -> Dict[str, Any]:
-    """Poll the nearest-edge lookup until the predicate succeeds or times out."""
+    """Poll the nearest-edge lookup until the predicate succeeds or times out.
+
+    The delay between polls starts at ``INITIAL_POLL_DELAY_SECONDS`` and doubles up to
+    ``interval``, so quick transitions are observed promptly while slow ones are not
+    hammered with requests.
+    """
 
     deadline = time.perf_counter() + timeout
     last_edge: Dict[str, Any] | None = None
+    delay = min(INITIAL_POLL_DELAY_SECONDS, interval)
 
-    while time.perf_counter() < deadline:
+    while (remaining := deadline - time.perf_counter()) > 0:
         edge = _lookup_edge()
         last_edge = edge
         if predicate(edge):
-            print(f"✅ {description}")
+            logger.info("✅ %s", description)
             return edge
-        time.sleep(interval)
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, interval)
 
     raise TimeoutError(f"Timed out waiting for condition: {description}; last edge={last_edge}")
 
 
 def _approx_equal(value: float, reference: float, *, tolerance: float = 1e-3) -> bool:
-    """Return True when value is approximately reference within tolerance."""
+    """Return True when value is approximately reference within tolerance.
+
+    ``tolerance`` acts both as a relative tolerance and as an absolute floor for small
+    references.
+    """
 
-    return abs(value - reference) <= tolerance * max(1.0, abs(reference))
+    return math.isclose(value, reference, rel_tol=tolerance, abs_tol=tolerance)
 
 
 def scenario_threshold_multiplier() -> None:
     """Validate that combined social scores gate the 1.5 multiplier."""
 
-    print("\n🧪 Scenario 1 – Threshold-gated Traffic multiplier")
+    logger.info("🧪 Scenario 1 – Threshold-gated Traffic multiplier")
     _purge_incidents()
 
     baseline_edge = _lookup_edge()
     baseline_weight = baseline_edge["weight"]
-    print(
-        f"Baseline edge: mode={baseline_edge['mode']} source={baseline_edge['source']} "
-        f"target={baseline_edge['target']} key={baseline_edge['key']} "
-        f"weight={baseline_weight:.2f}"
+    logger.info(
+        "Baseline edge: mode=%s source=%s target=%s key=%s weight=%.2f",
+        baseline_edge["mode"],
+        baseline_edge["source"],
+        baseline_edge["target"],
+        baseline_edge["key"],
+        baseline_weight,
     )
 
     initial_reports = [
@@ -178,12 +195,12 @@ def scenario_threshold_multiplier() -> None:
         },
     ]
 
-    print("Submitting initial incidents (below threshold)...")
+    logger.info("Submitting initial incidents (below threshold)...")
     for incident in initial_reports:
         _report_incident(incident)
 
     poll_wait = BACKGROUND_POLL_SECONDS + WAIT_INTERVAL_SECONDS
-    print(f"Waiting {poll_wait:.1f}s to allow background poller to process incidents...")
+    logger.info("Waiting %.1fs to allow background poller to process incidents...", poll_wait)
     time.sleep(poll_wait)
 
     def _unchanged(edge: Dict[str, Any]) -> bool:
@@ -204,7 +221,7 @@ def scenario_threshold_multiplier() -> None:
         "reporter_social_score": 15.0,
     }
 
-    print("Adding booster incident to exceed threshold...")
+    logger.info("Adding booster incident to exceed threshold...")
     _report_incident(booster_incident)
 
     target_weight = baseline_weight * 1.5
@@ -217,16 +234,17 @@ def scenario_threshold_multiplier() -> None:
         description="Edge weight scaled by Traffic multiplier (1.5)",
     )
 
-    print(
-        "Edge weight after multiplier: "
-        f"{updated_edge['weight']:.2f} (expected ≈{target_weight:.2f})"
+    logger.info(
+        "Edge weight after multiplier: %.2f (expected ≈%.2f)",
+        updated_edge["weight"],
+        target_weight,
     )
 
 
 def scenario_infinite_multiplier() -> None:
     """Validate that a "Crush" incident enforces a very large multiplier immediately."""
 
-    print("\n🧪 Scenario 2 – Immediate Crush multiplier (blocked route)")
+    logger.info("🧪 Scenario 2 – Immediate Crush multiplier (blocked route)")
     _purge_incidents()
 
     # Ensure the previous multiplier has been reverted before continuing.
@@ -246,7 +264,7 @@ def scenario_infinite_multiplier() -> None:
         "reporter_social_score": 5.0,
     }
 
-    print("Submitting crush incident (should apply immediately)...")
+    logger.info("Submitting crush incident (should apply immediately)...")
     _report_incident(crush_incident)
 
     def _blocked(edge: Dict[str, Any]) -> bool:
@@ -259,29 +277,32 @@ def scenario_infinite_multiplier() -> None:
         description="Edge weight increased to blocked state for crush incident",
     )
 
-    print(
-        "Edge weight after crush incident: "
-        f"{updated_edge['weight']:.2e} (baseline was {baseline_weight:.2f})"
+    logger.info(
+        "Edge weight after crush incident: %.2e (baseline was %.2f)",
+        updated_edge["weight"],
+        baseline_weight,
     )
 
 
 def main() -> None:
     """Execute both integration scenarios and report their outcomes."""
 
-    print("=== Incident Impact Threshold Scenarios ===")
-    print(f"Base URL: {BASE_URL}")
-    print(f"Coordinates: ({TEST_LATITUDE}, {TEST_LONGITUDE})")
+    logger.info("=== Incident Impact Threshold Scenarios ===")
+    logger.info("Base URL: %s", BASE_URL)
+    logger.info("Coordinates: (%s, %s)", TEST_LATITUDE, TEST_LONGITUDE)
 
     _check_server()
     scenario_threshold_multiplier()
     scenario_infinite_multiplier()
 
-    print("\n🎉 All scenarios completed successfully.")
+    logger.info("🎉 All scenarios completed successfully.")
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    logging.getLogger("httpx").setLevel(logging.WARNING)
     try:
         main()
     except Exception as error:  # pragma: no cover - script entry point guard
-        print(f"❌ Scenario execution failed: {error}")
+        logger.error("❌ Scenario execution failed: %s", error)
         sys.exit(1)